@@ -64,15 +64,36 @@ pub struct LatencyProfile {
     pub max: f64,
 }
 
+/// Precomputed Tukey fences for RTT outlier filtering. The bounds are
+/// constant for a given profile and multiplier, so building one before a
+/// retry loop reduces each check to two comparisons.
+#[derive(Debug, Clone, Copy)]
+pub struct RttFence {
+    pub lower: f64,
+    pub upper: f64,
+}
+
+impl RttFence {
+    pub fn contains(&self, rtt: f64) -> bool {
+        self.lower <= rtt && rtt <= self.upper
+    }
+}
+
 impl LatencyProfile {
     pub fn iqr(&self) -> f64 {
         self.q3 - self.q1
     }
 
+    pub fn fence(&self, multiplier: f64) -> RttFence {
+        let iqr = self.iqr();
+        RttFence {
+            lower: self.q1 - multiplier * iqr,
+            upper: self.q3 + multiplier * iqr,
+        }
+    }
+
     pub fn is_in_range(&self, rtt: f64, multiplier: f64) -> bool {
-        let lower = self.q1 - multiplier * self.iqr();
-        let upper = self.q3 + multiplier * self.iqr();
-        lower <= rtt && rtt <= upper
+        self.fence(multiplier).contains(rtt)
     }
 }
 
@@ -212,6 +233,27 @@ mod tests {
     use super::*;
     use chrono::Utc;
 
+    // ── LatencyProfile::fence ──
+
+    #[test]
+    fn latency_profile_fence_matches_is_in_range() {
+        let profile = LatencyProfile {
+            min: 0.040,
+            q1: 0.045,
+            median: 0.050,
+            mean: 0.050,
+            q3: 0.055,
+            max: 0.060,
+        };
+        let fence = profile.fence(1.5);
+        // IQR = 0.010 → lower = 0.030, upper = 0.070
+        assert!((fence.lower - 0.030).abs() < 1e-10);
+        assert!((fence.upper - 0.070).abs() < 1e-10);
+        for rtt in [0.029, 0.030, 0.050, 0.070, 0.071] {
+            assert_eq!(fence.contains(rtt), profile.is_in_range(rtt, 1.5));
+        }
+    }
+
     // ── ServerStatus::Display ──
 
     #[test]
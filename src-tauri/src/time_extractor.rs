@@ -8,29 +8,140 @@ pub trait TimeExtractor: Send + Sync {
 
     /// Extract the server's unix timestamp (whole seconds) from the response.
     fn extract_time(&self, response: &reqwest::Response) -> Result<i64, AppError>;
+
+    /// Extract only the server's seconds-since-midnight (UTC). Phase 3 of
+    /// the sync algorithm compares consecutive Date headers by difference,
+    /// so implementations may skip full calendar parsing here.
+    fn extract_seconds_of_day(&self, response: &reqwest::Response) -> Result<i64, AppError> {
+        Ok(self.extract_time(response)?.rem_euclid(86_400))
+    }
 }
 
 /// Default extractor: parses the standard HTTP `Date` response header.
 pub struct DateHeaderExtractor;
 
+/// Parse a two-digit ASCII number.
+fn two_digits(b: &[u8]) -> Option<i64> {
+    match (b[0], b[1]) {
+        (d1 @ b'0'..=b'9', d2 @ b'0'..=b'9') => Some((d1 - b'0') as i64 * 10 + (d2 - b'0') as i64),
+        _ => None,
+    }
+}
+
+/// Days from 1970-01-01 for a proleptic Gregorian civil date
+/// (Howard Hinnant's `days_from_civil` algorithm).
+fn days_from_civil(y: i64, m: i64, d: i64) -> i64 {
+    let y = if m <= 2 { y - 1 } else { y };
+    let era = y.div_euclid(400);
+    let yoe = y - era * 400;
+    let doy = (153 * ((m + 9) % 12) + 2) / 5 + d - 1;
+    let doe = yoe * 365 + yoe / 4 - yoe / 100 + doy;
+    era * 146097 + doe - 719468
+}
+
+/// Seconds-since-midnight from the HH:MM:SS field of an IMF-fixdate string.
+/// Partial evaluation of `parse_imf_fixdate` for callers that only need the
+/// difference between consecutive Date headers — skips the calendar fields.
+fn parse_fixdate_hms(s: &str) -> Option<i64> {
+    let b = s.as_bytes();
+    if b.len() != 29 || &b[26..29] != b"GMT" || b[19] != b':' || b[22] != b':' {
+        return None;
+    }
+    let hour = two_digits(&b[17..19])?;
+    let minute = two_digits(&b[20..22])?;
+    let second = two_digits(&b[23..25])?;
+    if hour > 23 || minute > 59 || second > 60 {
+        return None;
+    }
+    Some(hour * 3600 + minute * 60 + second)
+}
+
+/// Fast path for the fixed-layout IMF-fixdate form that RFC 9110 requires
+/// servers to send ("Sun, 06 Nov 1994 08:49:37 GMT"): constant-offset byte
+/// slicing plus integer date arithmetic instead of running the full RFC 2822
+/// grammar on every probe. Returns None for anything else so the caller can
+/// fall back to the general parser.
+fn parse_imf_fixdate(s: &str) -> Option<i64> {
+    let b = s.as_bytes();
+    if b.len() != 29
+        || &b[26..29] != b"GMT"
+        || b[3] != b','
+        || b[4] != b' '
+        || b[7] != b' '
+        || b[11] != b' '
+        || b[16] != b' '
+        || b[19] != b':'
+        || b[22] != b':'
+        || b[25] != b' '
+    {
+        return None;
+    }
+
+    let day = two_digits(&b[5..7])?;
+    let month = match &b[8..11] {
+        b"Jan" => 1,
+        b"Feb" => 2,
+        b"Mar" => 3,
+        b"Apr" => 4,
+        b"May" => 5,
+        b"Jun" => 6,
+        b"Jul" => 7,
+        b"Aug" => 8,
+        b"Sep" => 9,
+        b"Oct" => 10,
+        b"Nov" => 11,
+        b"Dec" => 12,
+        _ => return None,
+    };
+    let year = two_digits(&b[12..14])? * 100 + two_digits(&b[14..16])?;
+    let hour = two_digits(&b[17..19])?;
+    let minute = two_digits(&b[20..22])?;
+    let second = two_digits(&b[23..25])?;
+
+    if !(1..=31).contains(&day) || hour > 23 || minute > 59 || second > 60 {
+        return None;
+    }
+
+    Some(days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60 + second)
+}
+
+/// Pull the raw `Date` header value out of a response.
+fn date_header_str(response: &reqwest::Response) -> Result<&str, AppError> {
+    response
+        .headers()
+        .get("date")
+        .ok_or(AppError::NoDateHeader)?
+        .to_str()
+        .map_err(|_| AppError::InvalidDateHeader("non-ASCII header value".into()))
+}
+
 impl TimeExtractor for DateHeaderExtractor {
     fn name(&self) -> &str {
         "Date Header"
     }
 
     fn extract_time(&self, response: &reqwest::Response) -> Result<i64, AppError> {
-        let date_str = response
-            .headers()
-            .get("date")
-            .ok_or(AppError::NoDateHeader)?
-            .to_str()
-            .map_err(|_| AppError::InvalidDateHeader("non-ASCII header value".into()))?;
+        let date_str = date_header_str(response)?;
 
+        if let Some(timestamp) = parse_imf_fixdate(date_str) {
+            return Ok(timestamp);
+        }
+
+        // Non-standard or obsolete date forms take the general parser.
         let dt = chrono::DateTime::parse_from_rfc2822(date_str)
             .map_err(|e| AppError::InvalidDateHeader(e.to_string()))?;
 
         Ok(dt.timestamp())
     }
+
+    fn extract_seconds_of_day(&self, response: &reqwest::Response) -> Result<i64, AppError> {
+        if let Ok(date_str) = date_header_str(response) {
+            if let Some(hms) = parse_fixdate_hms(date_str) {
+                return Ok(hms);
+            }
+        }
+        Ok(self.extract_time(response)?.rem_euclid(86_400))
+    }
 }
 
 #[cfg(test)]
@@ -68,6 +179,65 @@ mod tests {
         assert_eq!(ts, 1_445_412_480);
     }
 
+    #[test]
+    fn parse_imf_fixdate_matches_rfc2822_parser() {
+        for date_str in [
+            "Sun, 06 Nov 1994 08:49:37 GMT",
+            "Wed, 21 Oct 2015 07:28:00 GMT",
+            "Thu, 01 Jan 1970 00:00:00 GMT",
+            "Tue, 29 Feb 2000 23:59:59 GMT",
+            "Sat, 31 Dec 2033 12:00:00 GMT",
+        ] {
+            let expected = chrono::DateTime::parse_from_rfc2822(date_str)
+                .unwrap()
+                .timestamp();
+            assert_eq!(
+                parse_imf_fixdate(date_str),
+                Some(expected),
+                "fast path disagrees with chrono for {date_str}"
+            );
+        }
+    }
+
+    #[test]
+    fn parse_imf_fixdate_rejects_non_fixdate_forms() {
+        // Wrong length, obsolete RFC 850 form, non-GMT zone, garbage
+        assert_eq!(parse_imf_fixdate("Wed, 1 Oct 2015 07:28:00 GMT"), None);
+        assert_eq!(parse_imf_fixdate("Sunday, 06-Nov-94 08:49:37 GMT"), None);
+        assert_eq!(parse_imf_fixdate("Wed, 21 Oct 2015 07:28:00 UTC"), None);
+        assert_eq!(parse_imf_fixdate("not-a-real-date"), None);
+    }
+
+    #[test]
+    fn parse_fixdate_hms_extracts_seconds_of_day() {
+        // 08:49:37 -> 8*3600 + 49*60 + 37 = 31777
+        assert_eq!(parse_fixdate_hms("Sun, 06 Nov 1994 08:49:37 GMT"), Some(31_777));
+        assert_eq!(parse_fixdate_hms("Thu, 01 Jan 1970 00:00:00 GMT"), Some(0));
+        assert_eq!(parse_fixdate_hms("Sunday, 06-Nov-94 08:49:37 GMT"), None);
+    }
+
+    #[test]
+    fn extract_seconds_of_day_agrees_with_extract_time() {
+        for date_str in [
+            "Wed, 21 Oct 2015 07:28:00 GMT",
+            "Wed, 21 Oct 2015 07:28:00 +0000", // fallback path
+        ] {
+            let resp = mock_response_with_date(date_str);
+            let sod = DateHeaderExtractor.extract_seconds_of_day(&resp).unwrap();
+            let resp = mock_response_with_date(date_str);
+            let full = DateHeaderExtractor.extract_time(&resp).unwrap();
+            assert_eq!(sod, full.rem_euclid(86_400));
+        }
+    }
+
+    #[test]
+    fn extract_time_falls_back_to_rfc2822_for_numeric_zone() {
+        // Valid RFC 2822 but not IMF-fixdate — must still parse via fallback
+        let resp = mock_response_with_date("Wed, 21 Oct 2015 07:28:00 +0000");
+        let ts = DateHeaderExtractor.extract_time(&resp).unwrap();
+        assert_eq!(ts, 1_445_412_480);
+    }
+
     #[test]
     fn extract_time_missing_date_header_returns_no_date_header_error() {
         let resp = mock_response_no_date();
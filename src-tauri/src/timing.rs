@@ -1,28 +1,180 @@
-use std::time::{Instant, SystemTime, UNIX_EPOCH};
+use std::time::{SystemTime, UNIX_EPOCH};
 
-/// High-precision wait. Sleeps for the bulk of the duration via
-/// `std::thread::sleep`, then busy-waits the final 100ms for sub-ms accuracy.
+#[cfg(not(target_os = "linux"))]
+use std::time::Instant;
+
+/// Monotonic timestamp in integer nanoseconds, for RTT and elapsed-time
+/// measurement.
+///
+/// On Linux this reads `CLOCK_MONOTONIC_RAW`, which is immune to the NTP
+/// frequency slewing that can stretch or compress `CLOCK_MONOTONIC` while a
+/// sync is in flight — exactly the window where the host clock is most
+/// likely being disciplined.
+#[cfg(target_os = "linux")]
+pub fn monotonic_raw_ns() -> i64 {
+    let mut ts = libc::timespec {
+        tv_sec: 0,
+        tv_nsec: 0,
+    };
+    // SAFETY: `ts` is a valid, writable timespec.
+    unsafe { libc::clock_gettime(libc::CLOCK_MONOTONIC_RAW, &mut ts) };
+    // i64::from rather than `as`: widens losslessly on 32-bit time_t/c_long
+    // targets and is the identity on 64-bit ones, without tripping
+    // clippy::unnecessary_cast on the latter.
+    i64::from(ts.tv_sec) * 1_000_000_000 + i64::from(ts.tv_nsec)
+}
+
+/// Fallback for non-Linux targets: `std::time::Instant` already wraps the
+/// platform's high-resolution counter (QueryPerformanceCounter on Windows).
+#[cfg(not(target_os = "linux"))]
+pub fn monotonic_raw_ns() -> i64 {
+    use std::sync::OnceLock;
+    static EPOCH: OnceLock<Instant> = OnceLock::new();
+    EPOCH.get_or_init(Instant::now).elapsed().as_nanos() as i64
+}
+
+/// Best-effort scheduler guard for the timing-critical wait.
+///
+/// Pins the calling thread to the CPU it is currently running on — a thread
+/// that migrates cores mid-wait eats a cold-cache reschedule right at the
+/// deadline, adding >100 µs of wakeup jitter — and tries to lower its nice
+/// value so the wakeup wins the run queue. Both changes are reverted on
+/// drop; either can fail silently (the nice change usually needs privileges)
+/// without affecting correctness.
+#[cfg(target_os = "linux")]
+struct SchedGuard {
+    old_mask: libc::cpu_set_t,
+    old_nice: Option<libc::c_int>,
+}
+
+#[cfg(target_os = "linux")]
+impl SchedGuard {
+    fn pin_current_thread() -> Option<Self> {
+        let set_size = std::mem::size_of::<libc::cpu_set_t>();
+        // SAFETY: zeroed cpu_set_t is the empty set; pid 0 addresses the
+        // calling thread for both sched_*affinity and get/setpriority.
+        unsafe {
+            let mut old_mask: libc::cpu_set_t = std::mem::zeroed();
+            if libc::sched_getaffinity(0, set_size, &mut old_mask) != 0 {
+                return None;
+            }
+
+            let cpu = libc::sched_getcpu();
+            if cpu < 0 {
+                return None;
+            }
+            let mut pinned: libc::cpu_set_t = std::mem::zeroed();
+            libc::CPU_SET(cpu as usize, &mut pinned);
+            if libc::sched_setaffinity(0, set_size, &pinned) != 0 {
+                return None;
+            }
+
+            // getpriority legitimately returns -1, so errno disambiguates.
+            *libc::__errno_location() = 0;
+            let current = libc::getpriority(libc::PRIO_PROCESS, 0);
+            let old_nice = if *libc::__errno_location() == 0
+                && libc::setpriority(libc::PRIO_PROCESS, 0, -10) == 0
+            {
+                Some(current)
+            } else {
+                None
+            };
+
+            Some(SchedGuard { old_mask, old_nice })
+        }
+    }
+}
+
+#[cfg(target_os = "linux")]
+impl Drop for SchedGuard {
+    fn drop(&mut self) {
+        // SAFETY: restores the values captured in pin_current_thread.
+        unsafe {
+            libc::sched_setaffinity(0, std::mem::size_of::<libc::cpu_set_t>(), &self.old_mask);
+            if let Some(nice) = self.old_nice {
+                libc::setpriority(libc::PRIO_PROCESS, 0, nice);
+            }
+        }
+    }
+}
+
+/// High-precision wait.
+///
+/// On Linux, sleeps to an absolute `CLOCK_MONOTONIC` deadline via
+/// `clock_nanosleep(TIMER_ABSTIME)`, which the kernel services with
+/// hrtimers at sub-millisecond accuracy — no CPU-hot spin needed.
+/// Elsewhere, sleeps the coarse portion via `std::thread::sleep` and
+/// busy-waits the final 100ms for sub-ms accuracy.
 pub fn precise_wait(seconds: f64) {
     if seconds <= 0.0 {
         return;
     }
 
-    let start = Instant::now();
-    let target = std::time::Duration::from_secs_f64(seconds);
+    #[cfg(target_os = "linux")]
+    {
+        let _sched = SchedGuard::pin_current_thread();
+        sleep_until_monotonic_deadline(seconds);
+    }
+
+    #[cfg(not(target_os = "linux"))]
+    {
+        let start = Instant::now();
+        let target = std::time::Duration::from_secs_f64(seconds);
 
-    // Sleep through the coarse portion (leave 100ms for busy-wait)
-    if seconds > 0.1 {
-        let sleep_duration = std::time::Duration::from_secs_f64(seconds - 0.1);
-        std::thread::sleep(sleep_duration);
+        // Sleep through the coarse portion (leave 100ms for busy-wait)
+        if seconds > 0.1 {
+            let sleep_duration = std::time::Duration::from_secs_f64(seconds - 0.1);
+            std::thread::sleep(sleep_duration);
+        }
+
+        // Busy-wait for the precise tail
+        while start.elapsed() < target {
+            std::hint::spin_loop();
+        }
     }
+}
+
+/// Sleep until `now + seconds` on `CLOCK_MONOTONIC` using an absolute
+/// deadline. An absolute deadline means a signal-interrupted sleep can be
+/// restarted without accumulating drift, unlike repeated relative sleeps.
+#[cfg(target_os = "linux")]
+fn sleep_until_monotonic_deadline(seconds: f64) {
+    let mut now = libc::timespec {
+        tv_sec: 0,
+        tv_nsec: 0,
+    };
+    // SAFETY: `now` is a valid, writable timespec.
+    unsafe { libc::clock_gettime(libc::CLOCK_MONOTONIC, &mut now) };
 
-    // Busy-wait for the precise tail
-    while start.elapsed() < target {
-        std::hint::spin_loop();
+    let deadline_ns =
+        now.tv_sec as i128 * 1_000_000_000 + now.tv_nsec as i128 + (seconds * 1e9) as i128;
+    let deadline = libc::timespec {
+        tv_sec: (deadline_ns / 1_000_000_000) as libc::time_t,
+        tv_nsec: (deadline_ns % 1_000_000_000) as libc::c_long,
+    };
+
+    loop {
+        // SAFETY: `deadline` is a valid timespec; the remain pointer may be
+        // NULL with TIMER_ABSTIME.
+        let rc = unsafe {
+            libc::clock_nanosleep(
+                libc::CLOCK_MONOTONIC,
+                libc::TIMER_ABSTIME,
+                &deadline,
+                std::ptr::null_mut(),
+            )
+        };
+        // Retry with the same absolute deadline if a signal interrupted us.
+        if rc != libc::EINTR {
+            break;
+        }
     }
 }
 
 /// Get the current system time as seconds since UNIX epoch (f64).
+/// Production code reads `system_time_ns`; tests still compare against
+/// fractional seconds directly.
+#[cfg(test)]
 pub fn system_time_secs() -> f64 {
     SystemTime::now()
         .duration_since(UNIX_EPOCH)
@@ -30,6 +182,15 @@ pub fn system_time_secs() -> f64 {
         .as_secs_f64()
 }
 
+/// Get the current system time as integer nanoseconds since UNIX epoch.
+/// Avoids the ~100ns rounding error a f64 epoch timestamp carries.
+pub fn system_time_ns() -> i64 {
+    SystemTime::now()
+        .duration_since(UNIX_EPOCH)
+        .expect("time went backwards")
+        .as_nanos() as i64
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -42,6 +203,39 @@ mod tests {
         assert!(ts > 1_700_000_000.0, "timestamp {ts} looks too small");
     }
 
+    #[test]
+    fn monotonic_raw_ns_is_monotonic() {
+        let a = monotonic_raw_ns();
+        let b = monotonic_raw_ns();
+        assert!(b >= a, "monotonic clock went backwards: {a} -> {b}");
+    }
+
+    #[cfg(target_os = "linux")]
+    #[test]
+    fn sched_guard_restores_affinity_on_drop() {
+        let set_size = std::mem::size_of::<libc::cpu_set_t>();
+        let before = unsafe {
+            let mut mask: libc::cpu_set_t = std::mem::zeroed();
+            assert_eq!(libc::sched_getaffinity(0, set_size, &mut mask), 0);
+            mask
+        };
+
+        drop(SchedGuard::pin_current_thread());
+
+        let after = unsafe {
+            let mut mask: libc::cpu_set_t = std::mem::zeroed();
+            assert_eq!(libc::sched_getaffinity(0, set_size, &mut mask), 0);
+            mask
+        };
+        for cpu in 0..(set_size * 8) {
+            assert_eq!(
+                unsafe { libc::CPU_ISSET(cpu, &before) },
+                unsafe { libc::CPU_ISSET(cpu, &after) },
+                "affinity for cpu {cpu} not restored"
+            );
+        }
+    }
+
     #[test]
     fn precise_wait_zero_returns_immediately() {
         let start = Instant::now();